@@ -8,6 +8,7 @@ Provides simple access to the `LoDoPaB-CT dataset
 import os
 from warnings import warn
 from math import ceil
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import h5py
 from zipfile import ZipFile
@@ -249,8 +250,8 @@ class LoDoPaBDataset(Dataset):
                     pass
             else:
                 def observation_trafo(obs):
-                    obs *= MU_MAX
-                    np.exp(-obs, out=obs)
+                    np.multiply(obs, -MU_MAX, out=obs)
+                    np.exp(obs, out=obs)
         else:
             shape = (self.shape[0] if num_samples == 1 else
                      (num_samples,) + self.shape[0])
@@ -266,8 +267,8 @@ class LoDoPaBDataset(Dataset):
             else:
                 def observation_trafo(obs):
                     np.greater_equal(obs, thres0, out=mask)
-                    obs *= MU_MAX
-                    np.exp(-obs, out=obs)
+                    np.multiply(obs, -MU_MAX, out=obs)
+                    np.exp(obs, out=obs)
                     obs[mask] = self.min_photon_count/PHOTONS_PER_PIXEL
         return observation_trafo
 
@@ -295,21 +296,35 @@ class LoDoPaBDataset(Dataset):
             return
         num_files = ceil(self.get_len(part) / NUM_SAMPLES_PER_FILE)
         observation_trafo = self.__get_observation_trafo()
-        for i in range(num_files):
-            with h5py.File(
-                    os.path.join(DATA_PATH, 'ground_truth_{}_{:03d}.hdf5'
-                                            .format(part, i)), 'r') as file:
-                ground_truth_data = file['data'][:]
-            with h5py.File(
-                    os.path.join(DATA_PATH, 'observation_{}_{:03d}.hdf5'
-                                            .format(part, i)), 'r') as file:
-                observation_data = file['data'][:]
-            for gt_arr, obs_arr in zip(ground_truth_data, observation_data):
-                ground_truth = self.space[1].element(gt_arr)
-                observation = self.space[0].element(obs_arr)
-                observation_trafo(observation)
-
-                yield (observation, ground_truth)
+        # read the next pair of files in the background while the samples of
+        # the current files are consumed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.__read_files, 0, part)
+            for i in range(num_files):
+                ground_truth_data, observation_data = future.result()
+                if i + 1 < num_files:
+                    future = executor.submit(self.__read_files, i + 1, part)
+                for gt_arr, obs_arr in zip(ground_truth_data,
+                                           observation_data):
+                    ground_truth = self.space[1].element(gt_arr)
+                    observation = self.space[0].element(obs_arr)
+                    observation_trafo(observation)
+
+                    yield (observation, ground_truth)
+
+    @staticmethod
+    def __read_files(file_index, part):
+        with h5py.File(
+                os.path.join(DATA_PATH, 'ground_truth_{}_{:03d}.hdf5'
+                                        .format(part, file_index)),
+                'r') as file:
+            ground_truth_data = file['data'][:]
+        with h5py.File(
+                os.path.join(DATA_PATH, 'observation_{}_{:03d}.hdf5'
+                                        .format(part, file_index)),
+                'r') as file:
+            observation_data = file['data'][:]
+        return ground_truth_data, observation_data
 
     def get_ray_trafo(self, **kwargs):
         """
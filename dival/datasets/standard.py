@@ -3,10 +3,8 @@
 """
 from warnings import warn
 import numpy as np
-from skimage.transform import resize
 import odl
 from dival.datasets.ellipses_dataset import EllipsesDataset
-from dival.datasets.lodopab_dataset import LoDoPaBDataset
 from dival.datasets.angle_subset_dataset import get_angle_subset_dataset
 
 
@@ -109,6 +107,8 @@ def get_standard_dataset(name, **kwargs):
     """
     name = name.lower()
     if name == 'ellipses':
+        from skimage.transform import resize
+
         fixed_seeds = kwargs.pop('fixed_seeds', False)
         ellipses_dataset = EllipsesDataset(image_size=128,
                                            fixed_seeds=fixed_seeds)
@@ -156,6 +156,9 @@ def get_standard_dataset(name, **kwargs):
         dataset.ray_trafo = reco_ray_trafo
 
     elif name == 'lodopab':
+        # import here, so that other datasets can be used if the LoDoPaB-CT
+        # configuration is not available
+        from dival.datasets.lodopab_dataset import LoDoPaBDataset
 
         num_angles = kwargs.pop('num_angles', None)
         lodopab_kwargs = {}
@@ -7,16 +7,80 @@ is used by the :mod:`~dival.evaluation` module.
 """
 from abc import ABC, abstractmethod
 from warnings import warn
+from math import sqrt, log10
 import numpy as np
-from skimage.metrics import structural_similarity
+from scipy.ndimage import uniform_filter
 from odl.operator.operator import Operator
 
 
-def gen_unique_name(name_orig):
-    i = 1
-    while True:
-        yield '{}_{}'.format(name_orig, str(i))
-        i += 1
+def _float32_if_mixed(reconstruction, ground_truth):
+    # if one of the (floating point) inputs is float32, compute in float32
+    # instead of promoting to float64, which would double the memory traffic
+    if (np.float32 in (reconstruction.dtype, ground_truth.dtype) and
+            np.issubdtype(reconstruction.dtype, np.floating) and
+            np.issubdtype(ground_truth.dtype, np.floating)):
+        return np.float32
+    return None
+
+
+def _subtract(reconstruction, ground_truth):
+    return np.subtract(reconstruction, ground_truth,
+                       dtype=_float32_if_mixed(reconstruction, ground_truth))
+
+
+def _squared_difference(reconstruction, ground_truth):
+    # square the difference in-place, avoiding an additional temporary array
+    # of the image size; the result is summed by numpy's pairwise summation,
+    # which (unlike ``np.dot``) stays accurate for large float32 inputs
+    diff = _subtract(reconstruction, ground_truth)
+    return np.square(diff, out=diff)
+
+
+def _mean_squared_error(reconstruction, ground_truth):
+    return np.mean(_squared_difference(reconstruction, ground_truth))
+
+
+def _mean_structural_similarity(reconstruction, ground_truth, data_range,
+                                win_size=7, K1=0.01, K2=0.03):
+    # equivalent to skimage's structural_similarity with default arguments
+    # (uniform window, sample covariance), but operating in-place where
+    # possible to avoid most of the image-sized temporaries
+    float_type = (reconstruction.dtype
+                  if reconstruction.dtype in (np.float32, np.float64) else
+                  np.float64)
+    x = reconstruction.astype(float_type, copy=False)
+    y = ground_truth.astype(float_type, copy=False)
+    num_px = win_size ** x.ndim
+    cov_norm = num_px / (num_px - 1)
+    C1 = (K1 * data_range) ** 2
+    C2 = (K2 * data_range) ** 2
+    ux = uniform_filter(x, size=win_size)
+    uy = uniform_filter(y, size=win_size)
+    uxx = uniform_filter(x * x, size=win_size)
+    uyy = uniform_filter(y * y, size=win_size)
+    uxy = uniform_filter(x * y, size=win_size)
+    uxuy = ux * uy
+    uxy -= uxuy
+    np.square(ux, out=ux)
+    np.square(uy, out=uy)
+    uxx -= ux
+    uyy -= uy
+    # A1 = 2 * ux * uy + C1  (in uxuy),  A2 = 2 * vxy + C2  (in uxy)
+    # B1 = ux**2 + uy**2 + C1  (in ux),  B2 = vx + vy + C2  (in uxx)
+    uxuy *= 2
+    uxuy += C1
+    uxy *= 2 * cov_norm
+    uxy += C2
+    ux += uy
+    ux += C1
+    uxx += uyy
+    uxx *= cov_norm
+    uxx += C2
+    uxuy *= uxy
+    ux *= uxx
+    uxuy /= ux
+    pad = (win_size - 1) // 2
+    return uxuy[(slice(pad, -pad),) * x.ndim].mean(dtype=np.float64)
 
 
 class Measure(ABC):
@@ -74,9 +138,12 @@ class Measure(ABC):
             self.short_name = self.__class__.__name__
         if self.short_name in self.__class__.measure_dict:
             old_short_name = self.short_name
-            unique_name = gen_unique_name(self.short_name)
-            while self.short_name in self.__class__.measure_dict:
-                self.short_name = next(unique_name)
+            prefix = '{}_'.format(old_short_name)
+            suffixes = (k[len(prefix):] for k in self.__class__.measure_dict
+                        if k.startswith(prefix))
+            i = 1 + max((int(suffix) for suffix in suffixes
+                         if suffix.isdecimal()), default=0)
+            self.short_name = '{}{:d}'.format(prefix, i)
             warn("Measure `short_name` '{}' already exists, changed to '{}'"
                  .format(old_short_name, self.short_name))
         self.__class__.measure_dict[self.short_name] = self
@@ -144,6 +211,34 @@ class Measure(ABC):
         return self._OperatorForFixedGroundTruth(self, ground_truth)
 
 
+class _DataRangeMixin:
+    """
+    Mixin for measures depending on the data range of the ground truth.
+
+    Subclasses implement ``_apply(reconstruction, ground_truth, data_range)``
+    and provide a :attr:`data_range` attribute. If `data_range` is `None`,
+    ``np.max(ground_truth) - np.min(ground_truth)`` is used. The operator for
+    a fixed ground truth determines the data range only once.
+    Must precede :class:`Measure` in the base classes.
+    """
+    class _OperatorForFixedGroundTruth(Measure._OperatorForFixedGroundTruth):
+        def __init__(self, measure, ground_truth):
+            super().__init__(measure, ground_truth)
+            self.data_range = measure._get_data_range(
+                np.asarray(ground_truth))
+
+        def _call(self, x):
+            return self.measure._apply(x, self.ground_truth, self.data_range)
+
+    def apply(self, reconstruction, ground_truth):
+        gt = np.asarray(ground_truth)
+        return self._apply(reconstruction, gt, self._get_data_range(gt))
+
+    def _get_data_range(self, ground_truth):
+        return (self.data_range if self.data_range is not None
+                else np.max(ground_truth) - np.min(ground_truth))
+
+
 class L2Measure(Measure):
     """The euclidean (l2) distance measure."""
     measure_type = 'distance'
@@ -153,8 +248,8 @@ class L2Measure(Measure):
                    'sqrt(sum((reconstruction-ground_truth)**2))')
 
     def apply(self, reconstruction, ground_truth):
-        return np.linalg.norm((np.asarray(reconstruction) -
-                               np.asarray(ground_truth)).flat)
+        return sqrt(np.sum(_squared_difference(np.asarray(reconstruction),
+                                               np.asarray(ground_truth))))
 
 
 L2 = L2Measure()
@@ -169,14 +264,14 @@ class MSEMeasure(Measure):
                    '1/n * sum((reconstruction-ground_truth)**2)')
 
     def apply(self, reconstruction, ground_truth):
-        return np.mean((np.asarray(reconstruction) -
-                        np.asarray(ground_truth))**2)
+        return _mean_squared_error(np.asarray(reconstruction),
+                                   np.asarray(ground_truth))
 
 
 MSE = MSEMeasure()
 
 
-class PSNRMeasure(Measure):
+class PSNRMeasure(_DataRangeMixin, Measure):
     """The peak signal-to-noise ratio (PSNR) measure.
 
     The data range is automatically determined from the ground truth if not
@@ -213,19 +308,34 @@ class PSNRMeasure(Measure):
                                                   self.data_range)
         super().__init__(short_name=short_name)
 
-    def apply(self, reconstruction, ground_truth):
+    @property
+    def data_range(self):
+        return self._data_range
+
+    @data_range.setter
+    def data_range(self, data_range):
+        self._data_range = data_range
+        # the term ``20*log10(data_range)`` is constant for fixed data range
+        # (``-inf`` for a data range of zero)
+        with np.errstate(divide='ignore'):
+            self._data_range_term = (20*np.log10(data_range)
+                                     if data_range is not None else None)
+
+    def _apply(self, reconstruction, ground_truth, data_range):
         gt = np.asarray(ground_truth)
-        mse = np.mean((np.asarray(reconstruction) - gt)**2)
+        mse = _mean_squared_error(np.asarray(reconstruction), gt)
         if mse == 0.:
             return float('inf')
-        data_range = self.data_range or (np.max(gt) - np.min(gt))
-        return 20*np.log10(data_range) - 10*np.log10(mse)
+        data_range_term = (self._data_range_term
+                           if self._data_range_term is not None
+                           else 20*np.log10(data_range))
+        return data_range_term - 10*log10(mse)
 
 
 PSNR = PSNRMeasure()
 
 
-class SSIMMeasure(Measure):
+class SSIMMeasure(_DataRangeMixin, Measure):
     """The structural similarity index measure."""
     measure_type = 'quality'
     short_name = 'ssim'
@@ -238,6 +348,9 @@ class SSIMMeasure(Measure):
         This is a wrapper for :func:`skimage.metrics.structural_similarity`.
         The data range is automatically determined from the ground truth if not
         given to the constructor.
+        If no further keyword arguments are specified, an equivalent, faster
+        implementation of the default variant (uniform 7x7 window, sample
+        covariance) is used.
 
         Parameters
         ----------
@@ -256,12 +369,21 @@ class SSIMMeasure(Measure):
                                                   self.data_range)
         super().__init__(short_name=short_name)
 
-    def apply(self, reconstruction, ground_truth):
-        gt = np.asarray(ground_truth)
-        data_range = (self.data_range if self.data_range is not None
-                      else np.max(gt) - np.min(gt))
-        return structural_similarity(reconstruction, gt, data_range=data_range,
-                            **self.kwargs)
+    def _apply(self, reconstruction, ground_truth, data_range):
+        reconstruction = np.asarray(reconstruction)
+        ground_truth = np.asarray(ground_truth)
+        float_type = _float32_if_mixed(reconstruction, ground_truth)
+        if float_type is not None:
+            reconstruction = reconstruction.astype(float_type, copy=False)
+            ground_truth = ground_truth.astype(float_type, copy=False)
+        if (not self.kwargs and reconstruction.shape == ground_truth.shape
+                and min(ground_truth.shape, default=0) >= 7):
+            return _mean_structural_similarity(reconstruction, ground_truth,
+                                               data_range)
+        # import here, because skimage.metrics is slow to import
+        from skimage.metrics import structural_similarity
+        return structural_similarity(reconstruction, ground_truth,
+                                     data_range=data_range, **self.kwargs)
 
 
 SSIM = SSIMMeasure()
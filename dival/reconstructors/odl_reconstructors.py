@@ -17,6 +17,21 @@ from odl.solvers.functional.functional import Functional
 from dival.reconstructors import Reconstructor, IterativeReconstructor
 
 
+def _cached_opnorm(reconstructor, key, op, **kwargs):
+    """
+    Return ``power_method_opnorm(op, **kwargs)``, computed only once per `key`
+    as long as ``reconstructor.op`` stays the same object.
+
+    The norms used for the step sizes only depend on ``reconstructor.op``,
+    so they are reused across calls to ``reconstruct``.
+    """
+    if getattr(reconstructor, '_op_norms_op', None) is not reconstructor.op:
+        reconstructor._op_norms = {}
+        reconstructor._op_norms_op = reconstructor.op
+    if key not in reconstructor._op_norms:
+        reconstructor._op_norms[key] = power_method_opnorm(op, **kwargs)
+    return reconstructor._op_norms[key]
+
 class FBPReconstructor(Reconstructor):
     HYPER_PARAMS = {
         'filter_type':
@@ -731,8 +746,8 @@ class ForwardBackwardReconstructor(IterativeReconstructor):
         l2_norm = 0.5 * L2NormSquared(self.op.range).translated(observation)
         l12_norm = self.lam * GroupL1Norm(gradient.range)
         g = [l2_norm, l12_norm]
-        op_norm = power_method_opnorm(self.op, maxiter=20)
-        gradient_norm = power_method_opnorm(gradient, maxiter=20)
+        op_norm = _cached_opnorm(self, 'op', self.op, maxiter=20)
+        gradient_norm = _cached_opnorm(self, 'gradient', gradient, maxiter=20)
         sigma_ray_trafo = 45.0 / op_norm ** 2
         sigma_gradient = 45.0 / gradient_norm ** 2
         sigma = [sigma_ray_trafo, sigma_gradient]
@@ -806,7 +821,7 @@ class ADMMReconstructor(IterativeReconstructor):
         l2_norm = L2NormSquared(self.op.range).translated(observation)
         l1_norm = self.lam * L1Norm(gradient.range)
         g = SeparableSum(l2_norm, l1_norm)
-        op_norm = 1.1 * power_method_opnorm(L, maxiter=20)
+        op_norm = 1.1 * _cached_opnorm(self, 'L', L, maxiter=20)
         sigma = self.tau * op_norm ** 2
         admm.admm_linearized(out_, f, g, L, self.tau, sigma,
                              self.niter, callback=self.callback)
@@ -872,7 +887,7 @@ class BFGSReconstructor(IterativeReconstructor):
         smoothed_l1 = MoreauEnvelope(l1_norm, sigma=0.03)
         regularizer = smoothed_l1 * gradient
         f = discrepancy + self.lam * regularizer
-        opnorm = power_method_opnorm(self.op)
+        opnorm = _cached_opnorm(self, 'op', self.op)
         hessinv_estimate = ScalingOperator(self.op.domain, 1 / opnorm ** 2)
         newton.bfgs_method(f, out_, maxiter=self.niter,
                            hessinv_estimate=hessinv_estimate,
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import unittest
+import warnings
+from unittest.mock import patch
+import numpy as np
+import odl
+from skimage.metrics import structural_similarity
+from dival.measure import (
+    Measure, L2, MSE, MSEMeasure, PSNR, PSNRMeasure, SSIM, SSIMMeasure)
+
+np.random.seed(1)
+
+
+class TestUniqueShortName(unittest.TestCase):
+    def test(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            first = MSEMeasure(short_name='test_unique')
+            second = MSEMeasure(short_name='test_unique')
+            self.assertEqual(second.short_name, 'test_unique_1')
+            # a gap in the suffixes, the next larger suffix is used
+            MSEMeasure(short_name='test_unique_3')
+            third = MSEMeasure(short_name='test_unique')
+            self.assertEqual(third.short_name, 'test_unique_4')
+            # non-decimal suffixes are ignored
+            MSEMeasure(short_name='test_unique_\u00b2')
+            MSEMeasure(short_name='test_unique_x')
+            fourth = MSEMeasure(short_name='test_unique')
+            self.assertEqual(fourth.short_name, 'test_unique_5')
+        self.assertIs(Measure.get_by_short_name('test_unique'), first)
+
+
+class TestOperatorForFixedGroundTruth(unittest.TestCase):
+    def test(self):
+        space = odl.uniform_discr([0, 0], [1, 1], (32, 32), dtype='float32')
+        ground_truth = space.element(np.random.random(space.shape))
+        reconstructions = [space.element(np.random.random(space.shape))
+                           for _ in range(3)]
+        for measure in [L2, MSE, PSNR, SSIM]:
+            op = measure.as_operator_for_fixed_ground_truth(ground_truth)
+            for reco in reconstructions:
+                self.assertAlmostEqual(op(reco),
+                                       measure.apply(reco, ground_truth))
+
+    def test_data_range_determined_once(self):
+        space = odl.uniform_discr([0, 0], [1, 1], (32, 32))
+        ground_truth = space.element(np.random.random(space.shape))
+        reconstructions = [space.element(np.random.random(space.shape))
+                           for _ in range(3)]
+        for measure in [PSNR, SSIM]:
+            values = [measure.apply(reco, ground_truth)
+                      for reco in reconstructions]
+            measure_cls = type(measure)
+            with patch.object(measure_cls, '_get_data_range', autospec=True,
+                              side_effect=measure_cls._get_data_range) as \
+                    get_data_range:
+                op = measure.as_operator_for_fixed_ground_truth(ground_truth)
+                for reco, value in zip(reconstructions, values):
+                    self.assertAlmostEqual(op(reco), value)
+            get_data_range.assert_called_once()
+
+
+class TestFloat32Accuracy(unittest.TestCase):
+    def test(self):
+        for shape, offset in [((64, 362, 362), 0.), ((1000, 513), 3.)]:
+            ground_truth = (np.random.random(shape) + offset).astype(
+                np.float32)
+            reconstruction = (ground_truth + 0.05 * np.random.normal(
+                size=shape)).astype(np.float32)
+            mse_true = np.mean(
+                (reconstruction.astype(np.float64) - ground_truth)**2)
+            self.assertLess(
+                abs(MSE.apply(reconstruction, ground_truth) - mse_true),
+                1e-6 * mse_true)
+            l2_true = np.sqrt(mse_true * ground_truth.size)
+            self.assertLess(
+                abs(L2.apply(reconstruction, ground_truth) - l2_true),
+                1e-6 * l2_true)
+
+
+class TestPSNR(unittest.TestCase):
+    def test_data_range_zero(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            psnr_zero = PSNRMeasure(data_range=0,
+                                    short_name='psnr_test_data_range_zero')
+        ground_truth = np.random.random((16, 16))
+        reconstruction = np.random.random((16, 16))
+        # the given data range must be used instead of the one of the
+        # ground truth
+        self.assertEqual(psnr_zero.apply(reconstruction, ground_truth),
+                         -np.inf)
+        op = psnr_zero.as_operator_for_fixed_ground_truth(
+            odl.uniform_discr([0, 0], [1, 1], (16, 16)).element(ground_truth))
+        self.assertEqual(op(reconstruction), -np.inf)
+
+
+class TestSSIM(unittest.TestCase):
+    def test_matches_skimage(self):
+        for dtype in [np.float32, np.float64]:
+            for shape in [(64, 64), (7, 9), (12, 10, 8), (50,)]:
+                ground_truth = np.random.random(shape).astype(dtype)
+                reconstruction = np.clip(
+                    ground_truth + 0.1 * np.random.normal(size=shape),
+                    0., 1.).astype(dtype)
+                data_range = np.max(ground_truth) - np.min(ground_truth)
+                value_true = structural_similarity(
+                    reconstruction, ground_truth, data_range=data_range)
+                value = SSIM.apply(reconstruction, ground_truth)
+                self.assertAlmostEqual(value, value_true,
+                                       places=6 if dtype == np.float32 else 12)
+
+    def test_fallback(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            ssim_win_size = SSIMMeasure(short_name='ssim_test_fallback',
+                                        win_size=5)
+        ground_truth = np.random.random((32, 32))
+        reconstruction = np.random.random((32, 32))
+        with patch('dival.measure._mean_structural_similarity') as fast_ssim:
+            value = ssim_win_size.apply(reconstruction, ground_truth)
+        fast_ssim.assert_not_called()
+        value_true = structural_similarity(
+            reconstruction, ground_truth, win_size=5,
+            data_range=np.max(ground_truth) - np.min(ground_truth))
+        self.assertEqual(value, value_true)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,9 @@ from odl.operator.default_ops import ScalingOperator
 from dival.reconstructors.reconstructor import (Reconstructor,
                                                 StandardIterativeReconstructor,
                                                 FunctionReconstructor)
-from dival.reconstructors.odl_reconstructors import LandweberReconstructor
+from dival.reconstructors.odl_reconstructors import (
+    LandweberReconstructor, ForwardBackwardReconstructor, BFGSReconstructor)
+import dival.reconstructors.odl_reconstructors as odl_reconstructors
 
 
 class TestReconstructor(unittest.TestCase):
@@ -212,5 +214,22 @@ class TestFunctionReconstructor(unittest.TestCase):
         self.assertEqual(out, fun(observation, *fun_args, **fun_kwargs))
 
 
+class TestOpNormCaching(unittest.TestCase):
+    def test(self):
+        domain = odl.uniform_discr([0, 0], [1, 1], (8, 8))
+        for reconstructor_cls, num_norms in [
+                (ForwardBackwardReconstructor, 2), (BFGSReconstructor, 1)]:
+            r = reconstructor_cls(odl.IdentityOperator(domain), domain.zero(),
+                                  niter=2)
+            with patch.object(odl_reconstructors, 'power_method_opnorm',
+                              wraps=odl.power_method_opnorm) as opnorm:
+                r.reconstruct(domain.one())
+                r.reconstruct(domain.one())
+                self.assertEqual(opnorm.call_count, num_norms)
+                r.op = odl.IdentityOperator(domain)
+                r.reconstruct(domain.one())
+                self.assertEqual(opnorm.call_count, 2 * num_norms)
+
+
 if __name__ == '__main__':
     unittest.main()